@@ -1,21 +1,13 @@
 from datasette import hookimpl
-from datasette.publish.common import (
-    add_common_publish_arguments_and_options,
-    fail_if_publish_binary_not_installed,
-)
-from datasette.utils import (
-    temporary_docker_directory,
-    value_as_boolean,
-    ValueAsBooleanError,
-)
 import click
 from click.types import CompositeParamType
+import jinja2
 from subprocess import run, CalledProcessError
 import json
 import os
 import pathlib
+import re
 import shutil
-import tempfile
 
 INDEX_PY = """
 from datasette.app import Datasette
@@ -25,7 +17,7 @@ import os
 
 static_mounts = [
     (static, str((pathlib.Path(".") / static).resolve()))
-    for static in {statics}
+    for static in {{ statics }}
 ]
 
 metadata = dict()
@@ -40,23 +32,30 @@ true, false = True, False
 
 ds = Datasette(
     [],
-    {database_files},
+    {{ database_files }},
     static_mounts=static_mounts,
-    metadata=metadata{extras},
+    metadata=metadata
+    {%- if template_dir %}, template_dir="templates"{% endif %}
+    {%- if plugins_dir %}, plugins_dir="plugins"{% endif %},
     secret=secret,
     cors=True,
-    settings={settings}{crossdb}
+    settings={{ settings }}
+    {%- if crossdb %},
+    crossdb=True{% endif %}
 )
 app = ds.app()
 """.strip()
 
+DEFAULT_BASE_IMAGE = "python:3.12-slim"
+
 DOCKERFILE = """
-FROM python:3.12-slim
+# syntax=docker/dockerfile:1
+FROM {{ base_image }}
 
 WORKDIR /app
 
 COPY requirements.txt ./
-RUN pip install --no-cache-dir -r requirements.txt
+RUN --mount=type=cache,target=/root/.cache/pip pip install -r requirements.txt
 
 COPY . .
 
@@ -66,89 +65,137 @@ EXPOSE 8001
 CMD ["uvicorn", "index:app", "--host", "0.0.0.0", "--port", "8001"]
 """.strip() + "\n"
 
+# Compiled once at import time and reused for every publish
+_JINJA = jinja2.Environment(autoescape=False, keep_trailing_newline=True)
+_INDEX_TMPL = _JINJA.from_string(INDEX_PY)
+_DOCKERFILE_TMPL = _JINJA.from_string(DOCKERFILE)
+
+# Shared compact encoder for generated code and API payloads. Non-ASCII is
+# escaped, so undecodable filenames (surrogate escapes) can still be written
+_COMPACT = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _parse_bool(value, name, param, ctx):
+    from datasette.utils import value_as_boolean, ValueAsBooleanError
+
+    try:
+        return value_as_boolean(value)
+    except ValueAsBooleanError:
+        raise click.BadParameter(
+            f'"{name}" should be on/off/true/false/1/0', ctx=ctx, param=param
+        )
+
+
+def _parse_int(value, name, param, ctx):
+    if not value.isdigit():
+        raise click.BadParameter(f'"{name}" should be an integer', ctx=ctx, param=param)
+    return int(value)
+
+
+def _parse_str(value, name, param, ctx):
+    return value
+
+
+_SETTING_PARSERS = None
+
+
+def _get_setting_parsers():
+    # Built on first use: maps each setting name to the parser for its type,
+    # or None for types we don't know how to parse.
+    global _SETTING_PARSERS
+    if _SETTING_PARSERS is None:
+        from datasette.app import DEFAULT_SETTINGS
+
+        parsers_by_type = {bool: _parse_bool, int: _parse_int, str: _parse_str}
+        _SETTING_PARSERS = {
+            name: parsers_by_type.get(type(default))
+            for name, default in DEFAULT_SETTINGS.items()
+        }
+    return _SETTING_PARSERS
+
 
 class Setting(CompositeParamType):
     name = "setting"
     arity = 2
 
     def convert(self, config, param, ctx):
-        from datasette.app import DEFAULT_SETTINGS
-
         name, value = config
-        if name not in DEFAULT_SETTINGS:
+        parsers = _get_setting_parsers()
+        if name not in parsers:
             self.fail(
                 f"{name} is not a valid option (--help-config to see all)",
                 param,
                 ctx,
             )
             return
-        default = DEFAULT_SETTINGS[name]
-        if isinstance(default, bool):
-            try:
-                return name, value_as_boolean(value)
-            except ValueAsBooleanError:
-                self.fail(f'"{name}" should be on/off/true/false/1/0', param, ctx)
-                return
-        elif isinstance(default, int):
-            if not value.isdigit():
-                self.fail(f'"{name}" should be an integer', param, ctx)
-                return
-            return name, int(value)
-        elif isinstance(default, str):
-            return name, value
-        else:
+        parser = parsers[name]
+        if parser is None:
             self.fail("Invalid option")
+            return
+        return name, parser(value, name, param, ctx)
+
+
+_USE_CURL_OPTION = click.option(
+    "--use-curl",
+    is_flag=True,
+    help="Trigger deployments by shelling out to curl instead of HTTP client",
+)
+
+_DOKPLOY_OPTION_DECORATORS = [
+    click.option(
+        "--image",
+        help="Container image name with tag, e.g. ghcr.io/owner/repo:latest",
+    ),
+    click.option(
+        "--generate-dir",
+        type=click.Path(dir_okay=True, file_okay=False),
+        help="Output generated application files and stop without deploying",
+    ),
+    click.option(
+        "--generate-github-actions",
+        is_flag=True,
+        help="Output GitHub Actions workflow YAML and stop",
+    ),
+    click.option(
+        "--dokploy-url",
+        help="Dokploy base URL, e.g. https://dokploy.example.com",
+    ),
+    click.option(
+        "--application-id",
+        help="Dokploy application ID for API-triggered deploy",
+    ),
+    click.option(
+        "--api-key",
+        help="Dokploy API key for API-triggered deploy",
+    ),
+    click.option(
+        "--deploy-url",
+        help="Dokploy deploy webhook URL",
+    ),
+    click.option(
+        "--token",
+        help="Optional bearer token for webhook-triggered deployments",
+    ),
+    _USE_CURL_OPTION,
+    click.option(
+        "--setting",
+        "settings",
+        type=Setting(),
+        help="Setting, see docs.datasette.io/en/stable/settings.html",
+        multiple=True,
+    ),
+    click.option("--crossdb", is_flag=True, help="Enable cross-database SQL queries"),
+    click.option(
+        "--base-image",
+        default=DEFAULT_BASE_IMAGE,
+        show_default=True,
+        help="Base image for the generated Dockerfile, e.g. pinned to a digest",
+    ),
+]
 
 
 def add_dokploy_options(cmd):
-    for decorator in reversed(
-        (
-            click.option(
-                "--image",
-                help="Container image name with tag, e.g. ghcr.io/owner/repo:latest",
-            ),
-            click.option(
-                "--generate-dir",
-                type=click.Path(dir_okay=True, file_okay=False),
-                help="Output generated application files and stop without deploying",
-            ),
-            click.option(
-                "--generate-github-actions",
-                is_flag=True,
-                help="Output GitHub Actions workflow YAML and stop",
-            ),
-            click.option(
-                "--dokploy-url",
-                help="Dokploy base URL, e.g. https://dokploy.example.com",
-            ),
-            click.option(
-                "--application-id",
-                help="Dokploy application ID for API-triggered deploy",
-            ),
-            click.option(
-                "--api-key",
-                help="Dokploy API key for API-triggered deploy",
-            ),
-            click.option(
-                "--deploy-url",
-                help="Dokploy deploy webhook URL",
-            ),
-            click.option(
-                "--token",
-                help="Optional bearer token for webhook-triggered deployments",
-            ),
-            click.option(
-                "--setting",
-                "settings",
-                type=Setting(),
-                help="Setting, see docs.datasette.io/en/stable/settings.html",
-                multiple=True,
-            ),
-            click.option(
-                "--crossdb", is_flag=True, help="Enable cross-database SQL queries"
-            ),
-        )
-    ):
+    for decorator in reversed(_DOKPLOY_OPTION_DECORATORS):
         cmd = decorator(cmd)
     return cmd
 
@@ -195,69 +242,108 @@ jobs:
 """
 
 
+_HTTP_CLIENT = None
+
+
+def _http_client():
+    # A single pooled client keeps the connection to Dokploy alive across
+    # requests and retries, rather than paying a new TLS handshake each time.
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        import httpx
+
+        _HTTP_CLIENT = httpx.Client(
+            transport=httpx.HTTPTransport(retries=3), timeout=30
+        )
+    return _HTTP_CLIENT
+
+
+def _parse_headers(headers):
+    parsed = {}
+    for header in headers:
+        key, _, value = header.partition(":")
+        parsed[key.strip()] = value.strip()
+    return parsed
+
+
+def _http_check(url, method, headers, data=None):
+    import httpx
+
+    try:
+        response = _http_client().request(
+            method, url, headers=_parse_headers(headers), content=data
+        )
+    except (httpx.HTTPError, httpx.InvalidURL) as ex:
+        raise click.ClickException(str(ex))
+    if response.status_code < 200 or response.status_code >= 300:
+        msg = response.text[:500].strip() or "(empty response body)"
+        raise click.ClickException(f"HTTP {response.status_code}: {msg}")
+
+
 def _curl_check(url, method, headers, data=None):
     # curl exits 0 for HTTP 401/403/etc., so we capture the status code and body
-    # and raise a ClickException for non-2xx responses.
-    body_file = tempfile.NamedTemporaryFile(delete=False)
-    body_file.close()
+    # and raise a ClickException for non-2xx responses. The body is written to
+    # stdout followed by the status code, and only decoded on error.
+    cmd = [
+        "curl",
+        "-sS",
+        "-X",
+        method,
+        url,
+        "-w",
+        "\n%{http_code}",
+    ]
+    for header in headers:
+        cmd.extend(["-H", header])
+    if data is not None:
+        cmd.extend(["-d", data])
+
+    result = run(cmd, capture_output=True)
+    body, _, status = (result.stdout or b"").rpartition(b"\n")
     try:
-        cmd = [
-            "curl",
-            "-sS",
-            "-X",
-            method,
-            url,
-            "-o",
-            body_file.name,
-            "-w",
-            "%{http_code}",
-        ]
-        for header in headers:
-            cmd.extend(["-H", header])
-        if data is not None:
-            cmd.extend(["-d", data])
-
-        result = run(cmd, capture_output=True, text=True)
-        stdout = (result.stdout or "").strip()
-        stderr = (result.stderr or "").strip()
-        try:
-            status = int(stdout) if stdout else 0
-        except ValueError:
-            status = 0
+        status = int(status)
+    except ValueError:
+        status = 0
+
+    if result.returncode != 0:
+        stderr = (result.stderr or b"").decode("utf-8", "replace").strip()
+        raise click.ClickException(stderr or f"curl failed with code {result.returncode}")
+    if status < 200 or status >= 300:
+        msg = body.decode("utf-8", "replace").strip() or "(empty response body)"
+        raise click.ClickException(f"HTTP {status}: {msg}")
+
+
+def _link_or_copy(src, dst):
+    # Replace files left behind by a previous export
+    if os.path.isdir(dst) and not os.path.islink(dst):
+        raise click.ClickException(f"Cannot export {src}: {dst} is a directory")
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device link or filesystem without hard link support
+        shutil.copy2(src, dst)
+
+
+def _export_directory(src, dst):
+    # Hard link files where possible so large database files are not copied
+    shutil.copytree(src, dst, copy_function=_link_or_copy, dirs_exist_ok=True)
 
-        try:
-            body = open(body_file.name, "r", encoding="utf-8", errors="replace").read()
-        except Exception:
-            body = ""
-
-        if result.returncode != 0:
-            raise click.ClickException(stderr or f"curl failed with code {result.returncode}")
-        if status < 200 or status >= 300:
-            msg = body.strip() or "(empty response body)"
-            raise click.ClickException(f"HTTP {status}: {msg}")
-        return body
-    finally:
-        try:
-            os.remove(body_file.name)
-        except OSError:
-            pass
+
+# datasette, datasette==0.65.2, datasette>=..., datasette[extra]==..., etc.
+_DATASETTE_REQ_RE = re.compile(r"^datasette(?:$|[=<>!~\[\s])", re.IGNORECASE)
 
 
 def _looks_like_datasette_requirement(req):
-    req = (req or "").strip().lower()
-    if not req.startswith("datasette"):
-        return False
-    if req == "datasette":
-        return True
-    # datasette==0.65.2, datasette>=..., datasette[extra]==..., etc.
-    next_ch = req[len("datasette") : len("datasette") + 1]
-    return next_ch in ("=", "<", ">", "!", "~", "[", " ")
+    return bool(_DATASETTE_REQ_RE.match((req or "").strip()))
 
 
-def _trigger_dokploy(dokploy_url, application_id, api_key):
+def _trigger_dokploy(dokploy_url, application_id, api_key, use_curl=False):
     url = dokploy_url.rstrip("/") + "/api/application.deploy"
-    payload = json.dumps({"applicationId": application_id})
-    _curl_check(
+    payload = _COMPACT({"applicationId": application_id})
+    check = _curl_check if use_curl else _http_check
+    check(
         url,
         "POST",
         headers=[
@@ -269,11 +355,93 @@ def _trigger_dokploy(dokploy_url, application_id, api_key):
     )
 
 
-def _trigger_webhook(deploy_url, token):
+def _trigger_webhook(deploy_url, token, use_curl=False):
     headers = []
     if token:
         headers.append(f"Authorization: Bearer {token}")
-    _curl_check(deploy_url, "POST", headers=headers)
+    check = _curl_check if use_curl else _http_check
+    check(deploy_url, "POST", headers=headers)
+
+
+def _deploy(dokploy_url, application_id, api_key, deploy_url, token, use_curl):
+    if dokploy_url and application_id and api_key:
+        _trigger_dokploy(dokploy_url, application_id, api_key, use_curl)
+    elif deploy_url:
+        _trigger_webhook(deploy_url, token, use_curl)
+
+
+def _build_image(image):
+    try:
+        # BuildKit is needed for the pip cache mount in the Dockerfile
+        run(
+            ["docker", "build", "-t", image, "."],
+            check=True,
+            env={**os.environ, "DOCKER_BUILDKIT": "1"},
+        )
+    except CalledProcessError as ex:
+        raise click.ClickException(str(ex))
+
+
+def _push_image(image):
+    try:
+        run(["docker", "push", image], check=True)
+    except CalledProcessError as ex:
+        raise click.ClickException(str(ex))
+
+
+def _write_app_files(
+    files,
+    branch,
+    template_dir,
+    plugins_dir,
+    static,
+    install,
+    settings,
+    crossdb,
+    base_image,
+):
+    # Writes Dockerfile, index.py and requirements.txt into the current
+    # directory, which should be a temporary_docker_directory()
+    # write_text() truncates, replacing the Dockerfile that
+    # temporary_docker_directory() wrote
+    pathlib.Path("Dockerfile").write_text(
+        _DOCKERFILE_TMPL.render(base_image=base_image)
+    )
+
+    statics = [item[0] for item in static]
+    pathlib.Path("index.py").write_text(
+        _INDEX_TMPL.render(
+            database_files=_COMPACT([os.path.split(f)[-1] for f in files]),
+            statics=_COMPACT(statics),
+            settings=_COMPACT(dict(settings) or {}),
+            template_dir=template_dir,
+            plugins_dir=plugins_dir,
+            crossdb=crossdb,
+        )
+    )
+
+    datasette_from_install = None
+    remaining = []
+    for req in install:
+        if not _looks_like_datasette_requirement(req):
+            remaining.append(req)
+        elif datasette_from_install is None:
+            datasette_from_install = req
+    install = remaining
+    if datasette_from_install and branch:
+        raise click.ClickException(
+            "Cannot use --branch and --install datasette... at the same time"
+        )
+
+    datasette_install = datasette_from_install or "datasette"
+    if branch and not datasette_from_install:
+        datasette_install = (
+            "https://github.com/simonw/datasette/archive/{}.zip".format(branch)
+        )
+
+    pathlib.Path("requirements.txt").write_text(
+        "\n".join([datasette_install, "pysqlite3-binary", "uvicorn", *install])
+    )
 
 
 def _publish(
@@ -303,9 +471,14 @@ def _publish(
     api_key,
     deploy_url,
     token,
+    use_curl,
     settings,
     crossdb,
+    base_image,
 ):
+    from datasette.publish.common import fail_if_publish_binary_not_installed
+    from datasette.utils import temporary_docker_directory
+
     if generate_dir:
         generate_dir = str(pathlib.Path(generate_dir).resolve())
 
@@ -339,50 +512,20 @@ def _publish(
         extra_metadata,
         port=8001,
     ):
-        if os.path.exists("Dockerfile"):
-            os.remove("Dockerfile")
-        open("Dockerfile", "w").write(DOCKERFILE)
-
-        extras = []
-        if template_dir:
-            extras.append('template_dir="templates"')
-        if plugins_dir:
-            extras.append('plugins_dir="plugins"')
-
-        statics = [item[0] for item in static]
-        open("index.py", "w").write(
-            INDEX_PY.format(
-                database_files=json.dumps([os.path.split(f)[-1] for f in files]),
-                extras=", {}".format(", ".join(extras)) if extras else "",
-                statics=json.dumps(statics),
-                settings=json.dumps(dict(settings) or {}),
-                crossdb=",\n    crossdb=True" if crossdb else "",
-            )
-        )
-
-        install = list(install)
-        datasette_from_install = next(
-            (req for req in install if _looks_like_datasette_requirement(req)), None
-        )
-        if datasette_from_install and branch:
-            raise click.ClickException(
-                "Cannot use --branch and --install datasette... at the same time"
-            )
-
-        datasette_install = datasette_from_install or "datasette"
-        if branch and not datasette_from_install:
-            datasette_install = (
-                "https://github.com/simonw/datasette/archive/{}.zip".format(branch)
-            )
-        if datasette_from_install:
-            install = [req for req in install if not _looks_like_datasette_requirement(req)]
-
-        open("requirements.txt", "w").write(
-            "\n".join([datasette_install, "pysqlite3-binary", "uvicorn"] + install)
+        _write_app_files(
+            files,
+            branch,
+            template_dir,
+            plugins_dir,
+            static,
+            install,
+            settings,
+            crossdb,
+            base_image,
         )
 
         if generate_dir:
-            shutil.copytree(".", generate_dir)
+            _export_directory(".", generate_dir)
             click.echo("Your generated application files have been written to:", err=True)
             click.echo(f"    {generate_dir}\n", err=True)
             click.echo("To deploy from GitHub Actions:", err=True)
@@ -401,25 +544,165 @@ def _publish(
         fail_if_publish_binary_not_installed(
             "docker", "Docker", "https://docs.docker.com/get-docker/"
         )
-        fail_if_publish_binary_not_installed("curl", "curl", "https://curl.se/")
+        if use_curl:
+            fail_if_publish_binary_not_installed("curl", "curl", "https://curl.se/")
+
+        _build_image(image)
+        _push_image(image)
+        _deploy(dokploy_url, application_id, api_key, deploy_url, token, use_curl)
 
+
+def _parse_manifest_settings(i, settings):
+    # Same checks as --setting, for values that came from a JSON manifest
+    if not isinstance(settings, dict):
+        raise click.ClickException(
+            f"Manifest entry {i}: \"settings\" must be an object"
+        )
+    parsers = _get_setting_parsers()
+    parsed = {}
+    for name, value in settings.items():
+        if name not in parsers:
+            raise click.ClickException(
+                f"Manifest entry {i}: {name} is not a valid setting"
+            )
+        parser = parsers[name]
+        if parser is None:
+            raise click.ClickException(f"Manifest entry {i}: Invalid option {name}")
         try:
-            run(["docker", "build", "-t", image, "."], check=True)
-            run(["docker", "push", image], check=True)
-        except CalledProcessError as ex:
-            raise click.ClickException(str(ex))
+            parsed[name] = parser(str(value), name, None, None)
+        except click.BadParameter as ex:
+            raise click.ClickException(f"Manifest entry {i}: {ex.message}")
+    return parsed
+
+
+def _publish_batch(manifest, use_curl, jobs):
+    from concurrent.futures import ThreadPoolExecutor
+    from datasette.publish.common import fail_if_publish_binary_not_installed
+    from datasette.utils import temporary_docker_directory
+
+    try:
+        entries = json.load(manifest)
+    except ValueError as ex:
+        raise click.ClickException(f"Invalid manifest JSON: {ex}")
+    if not isinstance(entries, list):
+        raise click.ClickException("Manifest must be a JSON list of deployments")
+    images = set()
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not entry.get("image") or not entry.get(
+            "files"
+        ):
+            raise click.ClickException(
+                f"Manifest entry {i} must be an object with \"files\" and \"image\""
+            )
+        for key in ("files", "install"):
+            value = entry.get(key)
+            if value is not None and not (
+                isinstance(value, list) and all(isinstance(v, str) for v in value)
+            ):
+                raise click.ClickException(
+                    f"Manifest entry {i}: \"{key}\" must be a list of strings"
+                )
+        for key in ("image", "metadata", "base_image"):
+            if entry.get(key) is not None and not isinstance(entry[key], str):
+                raise click.ClickException(
+                    f"Manifest entry {i}: \"{key}\" must be a string"
+                )
+        if not isinstance(entry.get("crossdb", False), bool):
+            raise click.ClickException(
+                f"Manifest entry {i}: \"crossdb\" must be true or false"
+            )
+        # Each build overwrites the image tag, so a shared image would end up
+        # deploying the last entry's files for every entry using it
+        if entry["image"] in images:
+            raise click.ClickException(
+                f"Manifest entry {i}: image {entry['image']} is used more than once"
+            )
+        images.add(entry["image"])
+        paths = entry["files"] + ([entry["metadata"]] if entry.get("metadata") else [])
+        for path in paths:
+            if not os.path.exists(path):
+                raise click.ClickException(f"Manifest entry {i}: {path} does not exist")
+        entry["settings"] = _parse_manifest_settings(i, entry.get("settings") or {})
+
+    fail_if_publish_binary_not_installed(
+        "docker", "Docker", "https://docs.docker.com/get-docker/"
+    )
+    if use_curl:
+        fail_if_publish_binary_not_installed("curl", "curl", "https://curl.se/")
 
-        if dokploy_url and application_id and api_key:
-            _trigger_dokploy(dokploy_url, application_id, api_key)
-        elif deploy_url:
-            _trigger_webhook(deploy_url, token)
+    # Builds run one at a time as each one changes into its own temporary
+    # directory; the pushes that follow only need the built images.
+    for entry in entries:
+        metadata = open(entry["metadata"]) if entry.get("metadata") else None
+        try:
+            with temporary_docker_directory(
+                entry["files"],
+                "datasette-dokploy",
+                metadata,
+                None,
+                None,
+                None,
+                None,
+                [],
+                entry.get("install") or [],
+                False,
+                None,
+                None,
+                port=8001,
+            ):
+                _write_app_files(
+                    entry["files"],
+                    None,
+                    None,
+                    None,
+                    [],
+                    entry.get("install") or [],
+                    entry["settings"],
+                    entry.get("crossdb", False),
+                    entry.get("base_image") or DEFAULT_BASE_IMAGE,
+                )
+                _build_image(entry["image"])
+        finally:
+            if metadata:
+                metadata.close()
+
+    # Uploads overlap on the network even though the daemon serializes work
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        list(executor.map(_push_image, [entry["image"] for entry in entries]))
+
+    for entry in entries:
+        _deploy(
+            entry.get("dokploy_url"),
+            entry.get("application_id"),
+            entry.get("api_key"),
+            entry.get("deploy_url"),
+            entry.get("token"),
+            use_curl,
+        )
 
 
 @hookimpl
 def publish_subcommand(publish):
+    from datasette.publish.common import add_common_publish_arguments_and_options
+
     @publish.command()
     @add_common_publish_arguments_and_options
     @add_dokploy_options
     def dokploy(*args, **kwargs):
         "Publish to self-hosted Dokploy"
         _publish(*args, **kwargs)
+
+    @publish.command(name="dokploy-batch")
+    @click.argument("manifest", type=click.File(mode="r"))
+    @_USE_CURL_OPTION
+    @click.option(
+        "-j",
+        "--jobs",
+        type=click.IntRange(min=1),
+        default=4,
+        show_default=True,
+        help="Number of images to push concurrently",
+    )
+    def dokploy_batch(manifest, use_curl, jobs):
+        "Build, push and deploy several Dokploy applications from a JSON manifest"
+        _publish_batch(manifest, use_curl, jobs)
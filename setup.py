@@ -26,7 +26,7 @@ setup(
     version=VERSION,
     packages=["datasette_publish_dokploy"],
     entry_points={"datasette": ["publish_dokploy = datasette_publish_dokploy"]},
-    install_requires=["datasette>=0.59"],
+    install_requires=["datasette>=0.59", "httpx", "jinja2"],
     extras_require={"test": ["pytest"]},
     tests_require=["datasette-publish-dokploy[test]"],
 )
@@ -1,6 +1,14 @@
 from click.testing import CliRunner
+import click
 from datasette import cli
+from datasette_publish_dokploy import (
+    _curl_check,
+    _looks_like_datasette_requirement,
+    _write_app_files,
+)
 from unittest import mock
+import httpx
+import json
 import os
 import pathlib
 import pytest
@@ -24,6 +32,44 @@ def test_publish_dokploy_generate_dir(mock_which):
             "requirements.txt",
             "test.db",
         }
+        dockerfile = open("app/Dockerfile").read()
+        assert "FROM python:3.12-slim\n" in dockerfile
+        assert "RUN --mount=type=cache,target=/root/.cache/pip pip install" in dockerfile
+
+
+@mock.patch("shutil.which")
+def test_publish_dokploy_base_image(mock_which):
+    mock_which.return_value = True
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        open("test.db", "w").write("data")
+        result = runner.invoke(
+            cli.cli,
+            [
+                "publish",
+                "dokploy",
+                "test.db",
+                "--base-image",
+                "python:3.12-slim@sha256:abc123",
+                "--generate-dir",
+                "app",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        dockerfile = open("app/Dockerfile").read()
+        assert "FROM python:3.12-slim@sha256:abc123\n" in dockerfile
+
+
+def test_write_app_files_non_utf8_filename(tmp_path, monkeypatch):
+    # Undecodable filenames arrive as surrogate escapes, which must not be
+    # written into index.py as raw characters
+    monkeypatch.chdir(tmp_path)
+    filename = "caf\udce9.db"
+    _write_app_files(
+        [filename], None, None, None, [], [], {}, False, "python:3.12-slim"
+    )
+    index_py = (tmp_path / "index.py").read_text()
+    assert '["caf\\udce9.db"]' in index_py
 
 
 @mock.patch("shutil.which")
@@ -69,17 +115,18 @@ def test_publish_dokploy_generate_workflow(mock_which):
 @mock.patch("datasette_publish_dokploy.run")
 def test_publish_dokploy_direct_api_trigger(mock_run, mock_which):
     mock_which.return_value = True
-    # First two run() calls are docker build/push (check=True).
-    # Third is curl with status/body capture (capture_output=True).
-    def fake_run(args, **kwargs):
-        if args[0] == "curl":
-            # Return HTTP status code in stdout
-            return mock.Mock(returncode=0, stdout="200", stderr="")
-        return mock.Mock(0)
+    mock_run.return_value = mock.Mock(0)
+    requests = []
 
-    mock_run.side_effect = fake_run
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
     runner = CliRunner()
-    with runner.isolated_filesystem():
+    with runner.isolated_filesystem(), mock.patch(
+        "datasette_publish_dokploy._HTTP_CLIENT", client
+    ):
         open("test.db", "w").write("data")
         result = runner.invoke(
             cli.cli,
@@ -99,18 +146,79 @@ def test_publish_dokploy_direct_api_trigger(mock_run, mock_which):
         )
         assert result.exit_code == 0, result.output
         # Verify docker build/push happened
-        assert mock_run.call_args_list[0] == mock.call(
-            ["docker", "build", "-t", "ghcr.io/me/repo:latest", "."], check=True
+        assert mock_run.call_args_list == [
+            mock.call(
+                ["docker", "build", "-t", "ghcr.io/me/repo:latest", "."],
+                check=True,
+                env=mock.ANY,
+            ),
+            mock.call(["docker", "push", "ghcr.io/me/repo:latest"], check=True),
+        ]
+        # Verify the deploy endpoint was called with API key + payload
+        assert len(requests) == 1
+        request = requests[0]
+        assert request.method == "POST"
+        assert str(request.url) == "https://dokploy.example.com/api/application.deploy"
+        assert request.headers["x-api-key"] == "secret"
+        assert request.headers["content-type"] == "application/json"
+        assert request.content == b'{"applicationId":"app-123"}'
+
+
+@mock.patch("shutil.which")
+@mock.patch("datasette_publish_dokploy.run")
+def test_publish_dokploy_api_trigger_http_error(mock_run, mock_which):
+    mock_which.return_value = True
+    mock_run.return_value = mock.Mock(0)
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(401, text="Unauthorized"))
+    )
+    runner = CliRunner()
+    with runner.isolated_filesystem(), mock.patch(
+        "datasette_publish_dokploy._HTTP_CLIENT", client
+    ):
+        open("test.db", "w").write("data")
+        result = runner.invoke(
+            cli.cli,
+            [
+                "publish",
+                "dokploy",
+                "test.db",
+                "--image",
+                "ghcr.io/me/repo:latest",
+                "--dokploy-url",
+                "https://dokploy.example.com",
+                "--application-id",
+                "app-123",
+                "--api-key",
+                "wrong",
+            ],
         )
-        assert mock_run.call_args_list[1] == mock.call(
-            ["docker", "push", "ghcr.io/me/repo:latest"], check=True
+        assert result.exit_code == 1
+        assert "HTTP 401: Unauthorized" in result.output
+
+
+@mock.patch("shutil.which")
+@mock.patch("datasette_publish_dokploy.run")
+def test_publish_dokploy_invalid_deploy_url(mock_run, mock_which):
+    mock_which.return_value = True
+    mock_run.return_value = mock.Mock(0)
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        open("test.db", "w").write("data")
+        result = runner.invoke(
+            cli.cli,
+            [
+                "publish",
+                "dokploy",
+                "test.db",
+                "--image",
+                "ghcr.io/me/repo:latest",
+                "--deploy-url",
+                "http://[::1",
+            ],
         )
-        # Verify curl was invoked against the correct endpoint with API key + payload
-        curl_args = mock_run.call_args_list[2].args[0]
-        assert curl_args[:5] == ["curl", "-sS", "-X", "POST", "https://dokploy.example.com/api/application.deploy"]
-        assert "x-api-key: secret" in curl_args
-        assert "content-type: application/json" in curl_args
-        assert '{"applicationId": "app-123"}' in curl_args
+        assert result.exit_code == 1
+        assert result.output.startswith("Error: ")
 
 
 @mock.patch("shutil.which")
@@ -119,7 +227,7 @@ def test_publish_dokploy_webhook_trigger(mock_run, mock_which):
     mock_which.return_value = True
     def fake_run(args, **kwargs):
         if args[0] == "curl":
-            return mock.Mock(returncode=0, stdout="200", stderr="")
+            return mock.Mock(returncode=0, stdout=b"{}\n200", stderr=b"")
         return mock.Mock(0)
 
     mock_run.side_effect = fake_run
@@ -138,12 +246,16 @@ def test_publish_dokploy_webhook_trigger(mock_run, mock_which):
                 "https://dokploy.example.com/hook/deploy",
                 "--token",
                 "tok",
+                "--use-curl",
             ],
         )
         assert result.exit_code == 0, result.output
         assert mock_run.call_args_list[0] == mock.call(
-            ["docker", "build", "-t", "ghcr.io/me/repo:latest", "."], check=True
+            ["docker", "build", "-t", "ghcr.io/me/repo:latest", "."],
+            check=True,
+            env=mock.ANY,
         )
+        assert mock_run.call_args_list[0].kwargs["env"]["DOCKER_BUILDKIT"] == "1"
         assert mock_run.call_args_list[1] == mock.call(
             ["docker", "push", "ghcr.io/me/repo:latest"], check=True
         )
@@ -152,6 +264,16 @@ def test_publish_dokploy_webhook_trigger(mock_run, mock_which):
         assert "Authorization: Bearer tok" in curl_args
 
 
+@mock.patch("datasette_publish_dokploy.run")
+def test_curl_check_reports_error_body(mock_run):
+    mock_run.return_value = mock.Mock(
+        returncode=0, stdout=b"Unauthorized\n401", stderr=b""
+    )
+    with pytest.raises(click.ClickException) as ex:
+        _curl_check("https://dokploy.example.com/hook/deploy", "POST", headers=[])
+    assert ex.value.message == "HTTP 401: Unauthorized"
+
+
 @mock.patch("shutil.which")
 def test_publish_dokploy_requires_image_for_direct_deploy(mock_which):
     mock_which.return_value = True
@@ -246,10 +368,266 @@ def test_publish_dokploy_generate(generated_app_dir):
         metadata=metadata,
         secret=secret,
         cors=True,
-        settings={"default_page_size": 10, "sql_time_limit_ms": 2000, "allow_download": false},
+        settings={"default_page_size":10,"sql_time_limit_ms":2000,"allow_download":false},
         crossdb=True
     )
     app = ds.app()
     """
         ).strip()
     )
+
+
+@mock.patch("shutil.which")
+def test_publish_dokploy_generate_template_and_plugins_dir(mock_which):
+    mock_which.return_value = True
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        open("test.db", "w").write("data")
+        os.mkdir("my-templates")
+        os.mkdir("my-plugins")
+        result = runner.invoke(
+            cli.cli,
+            [
+                "publish",
+                "dokploy",
+                "test.db",
+                "--template-dir",
+                "my-templates",
+                "--plugins-dir",
+                "my-plugins",
+                "--generate-dir",
+                "app",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        index_py = open("app/index.py").read()
+        assert (
+            'metadata=metadata, template_dir="templates", plugins_dir="plugins",\n'
+            in index_py
+        )
+        assert "crossdb" not in index_py
+        assert "    settings={}\n)" in index_py
+
+
+@pytest.mark.parametrize(
+    "setting,expected_error",
+    (
+        (["not_a_setting", "1"], "not_a_setting is not a valid option"),
+        (["default_page_size", "ten"], '"default_page_size" should be an integer'),
+        (["allow_download", "maybe"], '"allow_download" should be on/off/true/false/1/0'),
+    ),
+)
+def test_publish_dokploy_invalid_setting(setting, expected_error):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        open("test.db", "w").write("data")
+        result = runner.invoke(
+            cli.cli,
+            ["publish", "dokploy", "test.db", "--setting", *setting, "--generate-dir", "app"],
+        )
+        assert result.exit_code == 2
+        assert expected_error in result.output
+
+
+@mock.patch("shutil.which")
+def test_publish_dokploy_generate_dir_links_database(mock_which):
+    mock_which.return_value = True
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        open("test.db", "w").write("data")
+        for _ in range(2):
+            # Exporting into an existing directory should overwrite it
+            result = runner.invoke(
+                cli.cli,
+                ["publish", "dokploy", "test.db", "--generate-dir", "app"],
+            )
+            assert result.exit_code == 0, result.output
+        assert os.path.samefile("test.db", os.path.join("app", "test.db"))
+
+
+@mock.patch("shutil.which")
+def test_publish_dokploy_generate_dir_directory_in_the_way(mock_which):
+    mock_which.return_value = True
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        open("test.db", "w").write("data")
+        os.makedirs(os.path.join("app", "test.db"))
+        result = runner.invoke(
+            cli.cli,
+            ["publish", "dokploy", "test.db", "--generate-dir", "app"],
+        )
+        assert result.exit_code == 1
+        assert "test.db is a directory" in result.output
+
+
+@mock.patch("shutil.which")
+@mock.patch("datasette_publish_dokploy.run")
+def test_publish_dokploy_batch(mock_run, mock_which):
+    mock_which.return_value = True
+    index_pys = []
+
+    def fake_run(args, **kwargs):
+        if args[:2] == ["docker", "build"]:
+            index_pys.append(open("index.py").read())
+        return mock.Mock(0)
+
+    mock_run.side_effect = fake_run
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    runner = CliRunner()
+    with runner.isolated_filesystem(), mock.patch(
+        "datasette_publish_dokploy._HTTP_CLIENT", client
+    ):
+        open("one.db", "w").write("data")
+        open("two.db", "w").write("data")
+        with open("manifest.json", "w") as fp:
+            json.dump(
+                [
+                    {
+                        "files": ["one.db"],
+                        "image": "ghcr.io/me/one:latest",
+                        "settings": {"default_page_size": 10, "allow_download": False},
+                        "dokploy_url": "https://dokploy.example.com",
+                        "application_id": "app-1",
+                        "api_key": "secret",
+                    },
+                    {
+                        "files": ["two.db"],
+                        "image": "ghcr.io/me/two:latest",
+                        "deploy_url": "https://dokploy.example.com/hook/deploy",
+                        "token": "tok",
+                    },
+                ],
+                fp,
+            )
+        result = runner.invoke(
+            cli.cli, ["publish", "dokploy-batch", "manifest.json"]
+        )
+        assert result.exit_code == 0, result.output
+        calls = [c.args[0] for c in mock_run.call_args_list]
+        assert calls[:2] == [
+            ["docker", "build", "-t", "ghcr.io/me/one:latest", "."],
+            ["docker", "build", "-t", "ghcr.io/me/two:latest", "."],
+        ]
+        assert sorted(calls[2:]) == [
+            ["docker", "push", "ghcr.io/me/one:latest"],
+            ["docker", "push", "ghcr.io/me/two:latest"],
+        ]
+        assert [str(r.url) for r in requests] == [
+            "https://dokploy.example.com/api/application.deploy",
+            "https://dokploy.example.com/hook/deploy",
+        ]
+        assert requests[1].headers["authorization"] == "Bearer tok"
+        assert (
+            'settings={"default_page_size":10,"allow_download":false}' in index_pys[0]
+        )
+
+
+@pytest.mark.parametrize(
+    "manifest,expected_error",
+    (
+        (
+            [{"files": ["one.db"]}],
+            'Manifest entry 0 must be an object with "files" and "image"',
+        ),
+        (
+            [{"files": "one.db", "image": "x:1"}],
+            'Manifest entry 0: "files" must be a list of strings',
+        ),
+        (
+            [{"files": [1], "image": "x:1"}],
+            'Manifest entry 0: "files" must be a list of strings',
+        ),
+        (
+            [{"files": ["one.db"], "image": "x:1", "install": "datasette-cluster-map"}],
+            'Manifest entry 0: "install" must be a list of strings',
+        ),
+        (
+            [{"files": ["one.db"], "image": ["x:1"]}],
+            'Manifest entry 0: "image" must be a string',
+        ),
+        (
+            [{"files": ["one.db"], "image": "x:1", "metadata": 1}],
+            'Manifest entry 0: "metadata" must be a string',
+        ),
+        (
+            [{"files": ["one.db"], "image": "x:1", "base_image": 3.12}],
+            'Manifest entry 0: "base_image" must be a string',
+        ),
+        (
+            [{"files": ["one.db"], "image": "x:1", "crossdb": "yes"}],
+            'Manifest entry 0: "crossdb" must be true or false',
+        ),
+        (
+            [{"files": ["missing.db"], "image": "x:1"}],
+            "Manifest entry 0: missing.db does not exist",
+        ),
+        (
+            [{"files": ["one.db"], "image": "x:1", "metadata": "missing.json"}],
+            "Manifest entry 0: missing.json does not exist",
+        ),
+        (
+            [
+                {"files": ["one.db"], "image": "x:1"},
+                {"files": ["two.db"], "image": "x:1"},
+            ],
+            "Manifest entry 1: image x:1 is used more than once",
+        ),
+        (
+            [{"files": ["one.db"], "image": "x:1", "settings": {"not_a_setting": 5}}],
+            "Manifest entry 0: not_a_setting is not a valid setting",
+        ),
+        (
+            [
+                {
+                    "files": ["one.db"],
+                    "image": "x:1",
+                    "settings": {"default_page_size": "abc"},
+                }
+            ],
+            'Manifest entry 0: "default_page_size" should be an integer',
+        ),
+    ),
+)
+@mock.patch("shutil.which")
+@mock.patch("datasette_publish_dokploy.run")
+def test_publish_dokploy_batch_invalid_manifest(
+    mock_run, mock_which, manifest, expected_error
+):
+    mock_which.return_value = True
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        open("one.db", "w").write("data")
+        open("two.db", "w").write("data")
+        with open("manifest.json", "w") as fp:
+            json.dump(manifest, fp)
+        result = runner.invoke(
+            cli.cli, ["publish", "dokploy-batch", "manifest.json"]
+        )
+        assert result.exit_code == 1
+        assert expected_error in result.output
+        assert not mock_run.called
+
+
+@pytest.mark.parametrize(
+    "req,expected",
+    (
+        ("datasette", True),
+        (" Datasette==0.65.2 ", True),
+        ("datasette>=0.64", True),
+        ("datasette[test]", True),
+        ("datasette ~= 0.65", True),
+        ("datasette-cluster-map", False),
+        ("datasettes", False),
+        ("sqlite-utils", False),
+        ("", False),
+        (None, False),
+    ),
+)
+def test_looks_like_datasette_requirement(req, expected):
+    assert _looks_like_datasette_requirement(req) is expected